@@ -27,6 +27,7 @@
 
 use rayon::prelude::*;
 use std::collections::HashMap;
+use std::hash::{BuildHasherDefault, Hasher};
 
 use crate::data::Dataset;
 
@@ -72,6 +73,25 @@ impl BitMask {
         self.words.iter().map(|w| w.count_ones() as usize).sum()
     }
 
+    /// Iterate over the indices of set bits in ascending order.
+    ///
+    /// Walks whole words: empty words cost one compare per 64 positions,
+    /// and set bits are found with `trailing_zeros` (`TZCNT`) instead of
+    /// testing every index.
+    pub fn iter_ones(&self) -> impl Iterator<Item = usize> + '_ {
+        self.words.iter().enumerate().flat_map(|(w, &word)| {
+            let mut bits = word;
+            std::iter::from_fn(move || {
+                if bits == 0 {
+                    return None;
+                }
+                let bit = bits.trailing_zeros() as usize;
+                bits &= bits - 1;
+                Some((w << 6) | bit)
+            })
+        })
+    }
+
     /// Total number of tracked positions.
     #[allow(dead_code)]
     pub fn len(&self) -> usize {
@@ -190,6 +210,39 @@ impl SimHasher {
     }
 }
 
+// ─── PrehashedHasher ────────────────────────────────────────────────────────
+
+/// `Hasher` for keys that are already 64-bit hashes.
+///
+/// Exact-mode fingerprints are FNV-1a digests, so feeding them through the
+/// default SipHash costs more than the lookup itself. A single folded
+/// multiply spreads FNV's entropy into both the low bits (bucket index)
+/// and the high bits (control byte) that `HashMap` relies on.
+#[derive(Default)]
+struct PrehashedHasher(u64);
+
+impl Hasher for PrehashedHasher {
+    #[inline(always)]
+    fn finish(&self) -> u64 {
+        let folded = (self.0 as u128).wrapping_mul(0x9e3779b97f4a7c15);
+        (folded as u64) ^ ((folded >> 64) as u64)
+    }
+
+    #[inline(always)]
+    fn write_u64(&mut self, n: u64) {
+        self.0 = n;
+    }
+
+    fn write(&mut self, bytes: &[u8]) {
+        for &b in bytes {
+            self.0 = self.0.rotate_left(8) ^ b as u64;
+        }
+    }
+}
+
+/// `HashMap` keyed by precomputed 64-bit hashes.
+type PrehashedMap<V> = HashMap<u64, V, BuildHasherDefault<PrehashedHasher>>;
+
 // ─── Content Extraction ─────────────────────────────────────────────────────
 
 /// Extract string-value content from a JSON line without full deserialization.
@@ -198,8 +251,12 @@ impl SimHasher {
 /// stripping JSON structural characters. This is ~5x faster than
 /// `serde_json::from_str` for fingerprinting purposes because we
 /// never allocate a `Value` tree.
-fn extract_content_bytes(data: &[u8]) -> Vec<u8> {
-    let mut result = Vec::with_capacity(data.len() / 2);
+///
+/// Writes into `result` (cleared first) so callers can reuse one scratch
+/// buffer across many lines instead of allocating per line.
+fn extract_content_into(data: &[u8], result: &mut Vec<u8>) {
+    result.clear();
+    result.reserve(data.len() / 2);
     let mut in_string = false;
     let mut escaped = false;
     let mut is_value = false;
@@ -242,8 +299,6 @@ fn extract_content_bytes(data: &[u8]) -> Vec<u8> {
             _ => {}
         }
     }
-
-    result
 }
 
 // ─── Strategy ───────────────────────────────────────────────────────────────
@@ -382,18 +437,20 @@ impl DedupEngine {
 
         // ── Phase 1: Parallel fingerprinting ──────────────────────────
         // Each rayon worker reads directly from the mmap.
-        // No copies, no allocations (except the fingerprint Vec itself).
+        // No copies, no allocations (except the fingerprint Vec itself):
+        // SimHash content extraction reuses one scratch buffer per rayon
+        // job rather than allocating a Vec per line.
         let fingerprints: Vec<Fingerprint> = (0..line_count)
             .into_par_iter()
-            .map(|i| {
+            .map_init(Vec::new, |content, i| {
                 let line = dataset.get_line(i).unwrap_or("");
                 match self.strategy {
                     DedupStrategy::Exact => {
                         Fingerprint(self.hasher.hash_bytes(line.as_bytes()))
                     }
                     DedupStrategy::SimHash { .. } => {
-                        let content = extract_content_bytes(line.as_bytes());
-                        self.hasher.fingerprint(&content)
+                        extract_content_into(line.as_bytes(), content);
+                        self.hasher.fingerprint(content)
                     }
                 }
             })
@@ -407,9 +464,10 @@ impl DedupEngine {
 
         match self.strategy {
             DedupStrategy::Exact => {
-                // O(N) average with HashMap.
-                let mut seen: HashMap<u64, usize> =
-                    HashMap::with_capacity(line_count / 2);
+                // O(N) average with HashMap. Keys are already FNV-1a
+                // digests, so skip re-hashing them with SipHash.
+                let mut seen: PrehashedMap<usize> =
+                    PrehashedMap::with_capacity_and_hasher(line_count / 2, Default::default());
 
                 for (i, fp) in fingerprints.iter().enumerate() {
                     match seen.entry(fp.0) {
@@ -493,6 +551,18 @@ mod tests {
         assert_eq!(bm.count_ones(), 4);
     }
 
+    #[test]
+    fn test_bitmask_iter_ones() {
+        let mut bm = BitMask::new(200);
+        assert_eq!(bm.iter_ones().count(), 0);
+
+        for i in [0, 5, 63, 64, 130, 199] {
+            bm.set(i);
+        }
+        let ones: Vec<usize> = bm.iter_ones().collect();
+        assert_eq!(ones, vec![0, 5, 63, 64, 130, 199]);
+    }
+
     #[test]
     fn test_bitmask_out_of_bounds() {
         let bm = BitMask::new(10);
@@ -555,7 +625,8 @@ mod tests {
     #[test]
     fn test_extract_content_bytes() {
         let json = br#"{"prompt":"hello world","response":"goodbye moon"}"#;
-        let content = extract_content_bytes(json);
+        let mut content = Vec::new();
+        extract_content_into(json, &mut content);
         let text = String::from_utf8(content).unwrap();
         assert!(text.contains("hello world"), "Expected 'hello world' in '{}'", text);
         assert!(text.contains("goodbye moon"), "Expected 'goodbye moon' in '{}'", text);
@@ -566,11 +637,31 @@ mod tests {
     #[test]
     fn test_extract_content_nested() {
         let json = br#"{"messages":[{"role":"user","content":"What is Rust?"}]}"#;
-        let content = extract_content_bytes(json);
+        let mut content = Vec::new();
+        extract_content_into(json, &mut content);
         let text = String::from_utf8(content).unwrap();
         assert!(text.contains("What is Rust?"), "Expected nested content in '{}'", text);
     }
 
+    #[test]
+    fn test_prehashed_map_lookup() {
+        let hasher = SimHasher::default();
+        let mut map: PrehashedMap<usize> = PrehashedMap::default();
+        for (i, line) in ["alpha", "beta", "gamma"].iter().enumerate() {
+            map.insert(hasher.hash_bytes(line.as_bytes()), i);
+        }
+        assert_eq!(map.get(&hasher.hash_bytes(b"beta")), Some(&1));
+        assert_eq!(map.get(&hasher.hash_bytes(b"delta")), None);
+    }
+
+    #[test]
+    fn test_extract_content_reuses_buffer() {
+        let mut content = Vec::new();
+        extract_content_into(br#"{"a":"a much longer first value"}"#, &mut content);
+        extract_content_into(br#"{"b":"short"}"#, &mut content);
+        assert_eq!(content, b"short ");
+    }
+
     #[test]
     fn test_dedup_strategy_display() {
         assert_eq!(format!("{}", DedupStrategy::Exact), "exact");
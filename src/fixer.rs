@@ -249,7 +249,8 @@ pub struct FixSummary {
     pub fixed_lines: usize,
     pub unchanged_lines: usize,
     pub skipped_lines: usize,
-    pub fixes_by_type: std::collections::HashMap<String, usize>,
+    /// Count per fix, keyed by the static `FixType::description` string
+    pub fixes_by_type: std::collections::HashMap<&'static str, usize>,
 }
 
 impl FixSummary {
@@ -261,7 +262,7 @@ impl FixSummary {
         self.total_lines += 1;
         self.fixed_lines += 1;
         for fix in fixes {
-            *self.fixes_by_type.entry(fix.description().to_string()).or_insert(0) += 1;
+            *self.fixes_by_type.entry(fix.description()).or_insert(0) += 1;
         }
     }
 
@@ -330,6 +331,19 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_summary_counts_by_type() {
+        let mut summary = FixSummary::new();
+        summary.record_fixed(&[FixType::RemovedTrailingWhitespace]);
+        summary.record_fixed(&[FixType::RemovedTrailingWhitespace, FixType::AddedClosingThinkTag]);
+        summary.record_unchanged();
+
+        assert_eq!(summary.total_lines, 3);
+        assert_eq!(summary.fixed_lines, 2);
+        assert_eq!(summary.fixes_by_type[FixType::RemovedTrailingWhitespace.description()], 2);
+        assert_eq!(summary.fixes_by_type[FixType::AddedClosingThinkTag.description()], 1);
+    }
+
     #[test]
     fn test_skip_empty_line() {
         let fixer = Fixer::new();
@@ -158,20 +158,32 @@ impl Linter {
 }
 
 /// Extract all text content from a JSON value for analysis
+///
+/// String values are joined with single spaces into one buffer, so nested
+/// arrays and objects don't allocate an intermediate `String` per level.
 fn extract_text_content(value: &serde_json::Value) -> String {
+    let mut out = String::new();
+    push_text_content(value, &mut out);
+    out
+}
+
+/// Append the text content of `value` to `out`
+fn push_text_content(value: &serde_json::Value, out: &mut String) {
     match value {
-        serde_json::Value::String(s) => s.clone(),
-        serde_json::Value::Array(arr) => arr
-            .iter()
-            .map(extract_text_content)
-            .collect::<Vec<_>>()
-            .join(" "),
-        serde_json::Value::Object(obj) => obj
-            .values()
-            .map(extract_text_content)
-            .collect::<Vec<_>>()
-            .join(" "),
-        _ => String::new(),
+        serde_json::Value::String(s) => out.push_str(s),
+        serde_json::Value::Array(arr) => push_joined(arr.iter(), out),
+        serde_json::Value::Object(obj) => push_joined(obj.values(), out),
+        _ => {}
+    }
+}
+
+/// Append each value's text content to `out`, separated by spaces
+fn push_joined<'a>(values: impl Iterator<Item = &'a serde_json::Value>, out: &mut String) {
+    for (i, value) in values.enumerate() {
+        if i > 0 {
+            out.push(' ');
+        }
+        push_text_content(value, out);
     }
 }
 
@@ -195,4 +207,11 @@ mod tests {
         let results = linter.lint_line("not json {", 0);
         assert!(matches!(results[0].error, LintError::InvalidJson(_)));
     }
+
+    #[test]
+    fn test_extract_text_content() {
+        let value: serde_json::Value =
+            serde_json::from_str(r#"{"a": "x", "b": ["y", {"c": "z"}], "d": 1}"#).unwrap();
+        assert_eq!(extract_text_content(&value), "x y z ");
+    }
 }
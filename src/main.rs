@@ -27,6 +27,12 @@ use caret::tokenizer::{TiktokenEncoding, TokenizerType, TokenizerWrapper};
 use caret::tui::Tui;
 use caret::ui;
 
+/// Buffer size for headless export writers (dedup export, fix mode).
+///
+/// The `BufWriter` default of 8 KiB means one `write(2)` per handful of
+/// lines; 8 MiB chunks keep syscall count low on multi-GB outputs.
+const WRITE_BUFFER_SIZE: usize = 8 << 20;
+
 /// Caret - Blazingly fast TUI for LLM dataset curation
 #[derive(FromArgs)]
 struct Args {
@@ -274,31 +280,15 @@ fn main() -> Result<()> {
     let tui = Tui::new()?;
 
     if mcp_port > 0 || args.mcp_only {
-        // Snapshot the dataset into an Arc for the async MCP server.
-        // One-time copy cost — the server then holds a read-only reference.
-        let dataset_arc = {
-            let mut buf = Vec::new();
-            for i in 0..app.dataset.line_count() {
-                if let Some(line) = app.dataset.get_line(i) {
-                    buf.extend_from_slice(line.as_bytes());
-                    buf.push(b'\n');
-                }
-            }
-            let mut offsets = vec![0usize];
-            for (i, &b) in buf.iter().enumerate() {
-                if b == b'\n' && i + 1 < buf.len() {
-                    offsets.push(i + 1);
-                }
-            }
-            let size = buf.len() as u64;
-            Arc::new(Dataset::from_raw_parts(
-                buf,
-                offsets,
-                app.dataset.path.clone(),
-                size,
-                app.dataset.format,
-            ))
-        };
+        // Hand the async MCP server its own read-only dataset handle.
+        // Memory-mapped files share the TUI's mapping and line index, so the
+        // server adds no per-line memory however large the file is.
+        // In-memory datasets (stdin, Parquet, CSV, HF) pay a one-time copy.
+        let dataset_arc = Arc::new(
+            app.dataset
+                .shared_handle()
+                .unwrap_or_else(|| app.dataset.snapshot()),
+        );
 
         let dataset_path = app.dataset.path.clone();
         let port = if mcp_port > 0 { mcp_port } else { 3100 };
@@ -417,10 +407,8 @@ fn run_tui_loop(mut tui: Tui, mut app: App, mut tui_rx: Option<TuiCommandReceive
                     _ => {}
                 }
             }
-
-            if let Event::Resize(_, _) = event::read().unwrap_or(Event::FocusGained) {
-                // Resize handled automatically by ratatui
-            }
+            // Other events (including Resize) need no handling: ratatui
+            // picks up the new terminal size on the next draw.
         }
 
         if app.should_quit {
@@ -493,13 +481,14 @@ fn run_dedup_mode(args: &Args, dataset: &Dataset) -> Result<()> {
 
         let file = File::create(export_path)
             .with_context(|| format!("Failed to create export file: {}", export_path))?;
-        let mut writer = BufWriter::new(file);
+        let mut writer = BufWriter::with_capacity(WRITE_BUFFER_SIZE, file);
 
         let mut exported = 0usize;
         for i in 0..dataset.line_count() {
             if !result.is_duplicate(i) {
                 if let Some(line) = dataset.get_line(i) {
-                    writeln!(writer, "{}", line)?;
+                    writer.write_all(line.as_bytes())?;
+                    writer.write_all(b"\n")?;
                     exported += 1;
                 }
             }
@@ -548,18 +537,20 @@ fn run_fix_mode(args: &Args, dataset: &Dataset) -> Result<()> {
     // Open output file
     let file = File::create(&temp_path)
         .with_context(|| format!("Failed to create output file: {}", temp_path))?;
-    let mut writer = BufWriter::new(file);
+    let mut writer = BufWriter::with_capacity(WRITE_BUFFER_SIZE, file);
 
     // Process each line
     for i in 0..dataset.line_count() {
         if let Some(line) = dataset.get_line(i) {
             match fixer.fix_line(line) {
                 FixResult::Fixed { line: fixed, fixes } => {
-                    writeln!(writer, "{}", fixed)?;
+                    writer.write_all(fixed.as_bytes())?;
+                    writer.write_all(b"\n")?;
                     summary.record_fixed(&fixes);
                 }
                 FixResult::Unchanged(line) => {
-                    writeln!(writer, "{}", line)?;
+                    writer.write_all(line.as_bytes())?;
+                    writer.write_all(b"\n")?;
                     summary.record_unchanged();
                 }
                 FixResult::Skipped(reason) => {
@@ -568,7 +559,8 @@ fn run_fix_mode(args: &Args, dataset: &Dataset) -> Result<()> {
                         eprintln!("Line {}: {} (skipped)", i + 1, reason.description());
                     } else {
                         // Write original line even if invalid (preserve data)
-                        writeln!(writer, "{}", line)?;
+                        writer.write_all(line.as_bytes())?;
+                        writer.write_all(b"\n")?;
                         eprintln!("Line {}: {} (kept as-is)", i + 1, reason.description());
                     }
                 }
@@ -666,21 +666,19 @@ async fn tool_dedup_scan(
     match result {
         Ok(dr) => {
             // Collect a few sample duplicate pairs
-            let mut sample_pairs: Vec<serde_json::Value> = Vec::new();
-            let line_count = dr.total_lines;
-            for i in 0..line_count {
-                if sample_pairs.len() >= 5 {
-                    break;
-                }
-                if dr.is_duplicate(i) {
+            let sample_pairs: Vec<serde_json::Value> = dr
+                .duplicates
+                .iter_ones()
+                .take(5)
+                .map(|i| {
                     let canonical = dr.canonical_map[i];
-                    sample_pairs.push(serde_json::json!({
+                    serde_json::json!({
                         "duplicate_line": i + 1,
                         "original_line": canonical + 1,
                         "hamming_distance": dr.fingerprints[i].hamming_distance(dr.fingerprints[canonical]),
-                    }));
-                }
-            }
+                    })
+                })
+                .collect();
 
             let text = format!(
                 "Dedup Scan Results (strategy: {}):\n\
@@ -42,7 +42,7 @@ use serde::{Deserialize, Serialize};
 use tokio::sync::RwLock;
 use tracing::{debug, info, warn};
 
-use crate::data::Dataset;
+use crate::data::{build_line_offsets, Dataset};
 use crate::format::InputFormat;
 
 // ─── HF URL resolution ─────────────────────────────────────────────────────
@@ -472,12 +472,7 @@ pub async fn open_hf_stream(uri: &str) -> Result<(Dataset, RemoteParquetMeta)> {
     let size = buffer.len() as u64;
 
     // Build line index
-    let mut line_offsets = vec![0];
-    for (i, &byte) in buffer.iter().enumerate() {
-        if byte == b'\n' && i + 1 < buffer.len() {
-            line_offsets.push(i + 1);
-        }
-    }
+    let line_offsets = build_line_offsets(&buffer);
 
     let dataset = Dataset::from_raw_parts(
         buffer,